@@ -1,10 +1,10 @@
 import warnings
+from functools import lru_cache
 
 import numpy as np
 import numpy.polynomial.polynomial as poly
 import scipy
 import xarray as xr
-from xskillscore import pearson_r, pearson_r_p_value
 
 from .checks import has_dims, has_missing, is_xarray
 from .constants import CONCAT_KWARGS
@@ -31,6 +31,27 @@ def _check_y_not_independent_variable(y, dim):
         )
 
 
+def _to_numeric_time(x):
+    """Converts `x` to numeric time if it is a datetime or cftime axis.
+
+    This is done a single time up front so that the numeric functions applied over
+    each grid cell never see datetimes.
+
+    Args:
+        x (xr.DataArray or xr.Dataset): Independent variable from statistical functions.
+
+    Returns:
+        x (xr.DataArray or xr.Dataset): If `x` is a time axis, converts to numeric
+            time in days since 1990-01-01 as float64. Otherwise, return the original
+            `x` in its own dtype.
+    """
+    # Calling `TimeUtilAccessor` directly in the first case, so we don't trigger
+    # `flake8` F401 since we'd import a module but not use it.
+    if isinstance(x, xr.DataArray) and TimeUtilAccessor(x).is_temporal:
+        x = x.timeutils.return_numeric_time().astype("float64")
+    return x
+
+
 def _convert_time_and_return_slope_factor(x, dim):
     """Converts `x` to numeric time (if datetime) and returns slope factor.
 
@@ -53,13 +74,9 @@ def _convert_time_and_return_slope_factor(x, dim):
             can be inferred.
     """
     slope_factor = 1.0
-    if isinstance(x, xr.DataArray):
-        # Calling `TimeUtilAccessor` directly in the first case, so we don't trigger
-        # `flake8` F401 since we'd import a module but not use it.
-        if TimeUtilAccessor(x).is_temporal:
-            slope_factor = x.timeutils.slope_factor
-            x = x.timeutils.return_numeric_time()
-    return x, slope_factor
+    if isinstance(x, xr.DataArray) and TimeUtilAccessor(x).is_temporal:
+        slope_factor = x.timeutils.slope_factor
+    return _to_numeric_time(x), slope_factor
 
 
 def _handle_nans(x, y, nan_policy):
@@ -114,6 +131,25 @@ def _handle_nans(x, y, nan_policy):
         )
 
 
+def _horner(x, coefs):
+    """Evaluates polynomial(s) at ``x`` using Horner's method.
+
+    Args:
+        x (ndarray): 1D points of length T at which to evaluate the polynomial(s).
+        coefs (ndarray): Polynomial coefficients in increasing order with shape
+            (order + 1,) or (order + 1, N) for N polynomials.
+
+    Returns:
+        fit (ndarray): Polynomial(s) evaluated at ``x`` with shape (T,) or (T, N).
+    """
+    x = x.reshape(x.shape + (1,) * (coefs.ndim - 1))
+    fit = np.zeros(x.shape[:1] + coefs.shape[1:], dtype=np.result_type(x, coefs))
+    for c in coefs[::-1]:
+        fit *= x
+        fit += c
+    return fit
+
+
 def _polyfit(x, y, order, nan_policy):
     """Helper function for performing ``np.poly.polyfit`` which is used in both
     ``polyfit`` and ``rm_poly``.
@@ -147,7 +183,136 @@ def _polyfit(x, y, order, nan_policy):
     else:
         # fit to data without nans, return applied to original independent axis.
         coefs = poly.polyfit(x_mod, y_mod, order)
-        return poly.polyval(x, coefs)
+        return _horner(x, coefs)
+
+
+def _fit_dtype(y):
+    """Returns the precision to fit ``y`` in.
+
+    Single precision data is fit in single precision, which halves the memory traffic
+    of the fit. Everything else is fit in double precision.
+
+    Args:
+        y (xr.DataArray or xr.Dataset): Dependent variable used in the fit.
+
+    Returns:
+        dtype (str): "float32" if all of ``y`` is float32, otherwise "float64".
+    """
+    arrays = y.data_vars.values() if isinstance(y, xr.Dataset) else [y]
+    return "float32" if all(a.dtype == np.float32 for a in arrays) else "float64"
+
+
+@lru_cache(maxsize=32)
+def _vander_pinv(x_bytes, order, dtype):
+    """Returns the scaled independent axis and the pseudo-inverse of its Vandermonde
+    matrix.
+
+    This is cached so that repeated fits against the same axis (e.g., ``polyfit``
+    followed by ``rm_poly``, each dask chunk, or each variable in a Dataset) skip
+    the factorization.
+
+    Args:
+        x_bytes (bytes): Raw float64 buffer of the 1D independent variable. ndarrays
+            aren't hashable, so their bytes are used as the cache key.
+        order (int): Order of polynomial fit to perform.
+        dtype (str): Precision to return ``x`` and ``pinv`` in. These are always
+            computed in double precision and are only returned in single precision
+            if the Vandermonde matrix is well-conditioned enough for it.
+
+    Returns:
+        x (ndarray): Independent variable centered and (unless constant) scaled onto
+            [-1, 1]. The fitted values are unchanged by this, but it keeps the
+            Vandermonde matrix well-conditioned for higher orders.
+        pinv (ndarray): Pseudo-inverse of the Vandermonde matrix of ``x`` with shape
+            (order + 1, T).
+    """
+    x = np.frombuffer(x_bytes)
+    x = x - x.mean()
+    scale = np.abs(x).max()
+    # A constant (e.g., single time step) axis is left unscaled rather than
+    # dividing by zero.
+    if scale > 0:
+        x = x / scale
+    V = np.vander(x, order + 1, increasing=True)
+    pinv = np.linalg.pinv(V)
+    if np.linalg.cond(V) <= 1e6:
+        x = x.astype(dtype, copy=False)
+        pinv = pinv.astype(dtype, copy=False)
+    # These are shared between calls, so guard them against in-place modification.
+    x.setflags(write=False)
+    pinv.setflags(write=False)
+    return x, pinv
+
+
+def _polyfit_shared_x(x, y, order, dtype="float64"):
+    """Polynomial fit of every series in ``y`` against a single shared ``x``.
+
+    Rather than looping over every grid cell, this solves the least squares problem
+    for all series at once by applying the (cached) pseudo-inverse of the
+    Vandermonde matrix of ``x``.
+
+    Args:
+        x (ndarray): 1D independent variable of length T.
+        y (ndarray): Dependent variable(s) with shape (..., T).
+        order (int): Order of polynomial fit to perform.
+        dtype (str, optional): Precision to fit in and return. Defaults to "float64".
+
+    Returns:
+        fit (ndarray): Polynomial fit with the same shape as ``y``. Series with any
+            nans return all nans.
+    """
+    dtype = str(dtype)
+    # This catches cases where there is missing values in the independent axis.
+    if has_missing(x):
+        return np.full(y.shape, np.nan, dtype=dtype)
+    # ``x`` may be any numeric dtype (e.g., integer years), so it's cast here to
+    # give a consistent cache key.
+    x, pinv = _vander_pinv(np.asarray(x, dtype="float64").tobytes(), int(order), dtype)
+    # Lay ``y`` out time-major as a C-contiguous (T, N) array. This costs one copy,
+    # but every subsequent operation along time is then unit-stride.
+    Y = np.ascontiguousarray(np.moveaxis(y, -1, 0), dtype=pinv.dtype)
+    Y = Y.reshape(x.size, -1)
+    coefs = pinv @ Y
+    fit = _horner(x, coefs).reshape((x.size,) + y.shape[:-1])
+    return np.moveaxis(fit, 0, -1).astype(dtype, copy=False)
+
+
+def _pearson_r(x, y, dim):
+    """Pearson product-moment correlation coefficient in closed form.
+
+    Args:
+        x, y (xarray object): Time series being correlated.
+        dim (str): Dimension to calculate correlation over.
+
+    Returns:
+        corrcoef (xarray object): Pearson correlation coefficient. If a nan exists
+            anywhere along ``dim``, returns nan.
+    """
+    x_anom = x - x.mean(dim, skipna=False)
+    y_anom = y - y.mean(dim, skipna=False)
+    cov = (x_anom * y_anom).sum(dim, skipna=False)
+    x_var = (x_anom ** 2).sum(dim, skipna=False)
+    y_var = (y_anom ** 2).sum(dim, skipna=False)
+    # Guard against floating point error pushing ``r`` just outside of [-1, 1].
+    return (cov / np.sqrt(x_var * y_var)).clip(-1.0, 1.0)
+
+
+def _pearson_r_p_value(r, dof):
+    """Two-tailed p value for a Pearson correlation coefficient.
+
+    Uses the fact that ``r * sqrt(dof / (1 - r**2))`` follows a Student's
+    t-distribution with ``dof`` degrees of freedom.
+
+    Args:
+        r (ndarray): Pearson correlation coefficient(s).
+        dof (int): Degrees of freedom, i.e. the number of samples minus two.
+
+    Returns:
+        pval (ndarray): Two-tailed p value(s).
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = r * np.sqrt(dof / ((1.0 - r) * (1.0 + r)))
+    return 2 * scipy.special.stdtr(dof, -np.abs(t))
 
 
 def _warn_if_not_converted_to_original_time_units(x):
@@ -230,19 +395,29 @@ def corr(x, y, dim="time", lead=0, return_p=False):
         shifted = y.isel({dim: slice(0 + lead, N)})
         # Align dimensions for xarray operation.
         shifted[dim] = normal[dim]
-        corrcoef = pearson_r(normal, shifted, dim)
+        corrcoef = _pearson_r(normal, shifted, dim)
         if return_p:
-            pval = pearson_r_p_value(normal, shifted, dim)
+            # The p value only depends on ``r``, so it's computed from it directly
+            # rather than correlating the time series a second time.
+            pval = xr.apply_ufunc(
+                _pearson_r_p_value,
+                corrcoef,
+                normal[dim].size - 2,
+                dask="parallelized",
+                output_dtypes=["float64"],
+            )
             return corrcoef, pval
         else:
             return corrcoef
 
-    # Broadcasts a time series to the same coordinates/size as the grid. If they
-    # are both grids, this function does nothing and isn't expensive.
-    x, y = xr.broadcast(x, y)
+    # Align the two objects so that they can be sliced positionally along ``dim``
+    # below. A time series isn't broadcast to the size of a grid up front; that
+    # happens lazily in the correlation arithmetic, so its anomalies and variance
+    # are only computed once rather than for every grid cell.
+    x, y = xr.align(x, y, join="outer")
 
     # I don't want to guess coordinates for the user.
-    if (dim not in list(x.coords)) or (dim not in list(y.coords)):
+    if (dim not in list(x.coords)) and (dim not in list(y.coords)):
         raise ValueError(
             f"Make sure that the dimension {dim} has coordinates. "
             "`xarray` apply_ufunc alignments break when they can't reference "
@@ -437,7 +612,11 @@ def polyfit(x, y=None, order=None, dim="time", nan_policy="none"):
 
     .. note::
 
-        This will be released as a standard ``xarray`` func in 0.15.2.
+        ``xarray`` ships ``DataArray.polyfit``, which returns the polynomial
+        coefficients rather than the fitted line. When every grid cell shares the same
+        independent axis, this function fits them all at once against a centered and
+        scaled copy of that axis, which is faster and better conditioned at higher
+        orders than fitting against the raw (e.g., datetime) coordinate.
 
     Args:
         x (xarray object): Independent variable used in the polynomial fit.
@@ -464,15 +643,34 @@ def polyfit(x, y=None, order=None, dim="time", nan_policy="none"):
         raise ValueError("Please enter an order of polynomial to fit.")
     if y is None:
         has_dims(x, dim, "predictand (x)")
-        X, _ = _convert_time_and_return_slope_factor(x[dim], dim)
+        X = _to_numeric_time(x[dim])
         Y = x
     else:
         has_dims(x, dim, "predictor (x)")
         has_dims(y, dim, "predictand (y)")
         _check_y_not_independent_variable(y, dim)
-        X, _ = _convert_time_and_return_slope_factor(x, dim)
+        X = _to_numeric_time(x)
         Y = y
 
+    # Fit all grid cells at once when they share the same independent axis.
+    if (
+        isinstance(X, xr.DataArray)
+        and (X.ndim == 1)
+        and (nan_policy in ["none", "propagate"])
+    ):
+        dtype = _fit_dtype(Y)
+        return xr.apply_ufunc(
+            _polyfit_shared_x,
+            X,
+            Y,
+            order,
+            dtype,
+            dask="parallelized",
+            input_core_dims=[[dim], [dim], [], []],
+            output_core_dims=[[dim]],
+            output_dtypes=[dtype],
+        )
+
     vectorize = False if len(Y.dims) == 1 else True
 
     return xr.apply_ufunc(
@@ -517,19 +715,42 @@ def rm_poly(x, y=None, order=None, dim="time", nan_policy="none"):
         raise ValueError("Please enter an order of polynomial to remove.")
     if y is None:
         has_dims(x, dim, "predictand (x)")
-        X, _ = _convert_time_and_return_slope_factor(x[dim], dim)
+        X = _to_numeric_time(x[dim])
         Y = x
     else:
         has_dims(x, dim, "predictor (x)")
         has_dims(y, dim, "predictand (y)")
         _check_y_not_independent_variable(y, dim)
-        X, _ = _convert_time_and_return_slope_factor(x, dim)
+        X = _to_numeric_time(x)
         Y = y
 
     def _rm_poly(x, y, order, nan_policy):
         fit = _polyfit(x, y, order, nan_policy)
         return y - fit
 
+    def _rm_poly_shared_x(x, y, order, dtype):
+        fit = _polyfit_shared_x(x, y, order, dtype)
+        return y - fit
+
+    # Detrend all grid cells at once when they share the same independent axis.
+    if (
+        isinstance(X, xr.DataArray)
+        and (X.ndim == 1)
+        and (nan_policy in ["none", "propagate"])
+    ):
+        dtype = _fit_dtype(Y)
+        return xr.apply_ufunc(
+            _rm_poly_shared_x,
+            X,
+            Y,
+            order,
+            dtype,
+            dask="parallelized",
+            input_core_dims=[[dim], [dim], [], []],
+            output_core_dims=[[dim]],
+            output_dtypes=[dtype],
+        )
+
     vectorize = False if len(Y.dims) == 1 else True
 
     return xr.apply_ufunc(
@@ -569,7 +790,60 @@ def rm_trend(x, y=None, dim="time", nan_policy="none"):
     Returns:
         xarray object: ``y`` with linear fit removed.
     """
-    return rm_poly(x, y, 1, dim=dim, nan_policy=nan_policy)
+    # Validation of nans is left to ``rm_poly``.
+    if nan_policy not in ["none", "propagate", "omit", "drop"]:
+        return rm_poly(x, y, 1, dim=dim, nan_policy=nan_policy)
+    if y is None:
+        has_dims(x, dim, "predictand (x)")
+        X = _to_numeric_time(x[dim])
+        Y = x
+    else:
+        has_dims(x, dim, "predictor (x)")
+        has_dims(y, dim, "predictand (y)")
+        _check_y_not_independent_variable(y, dim)
+        X = _to_numeric_time(x)
+        Y = y
+
+    # Match ``rm_poly``, which requires ``x`` and ``y`` to share the same coordinates
+    # through ``xr.apply_ufunc``, rather than silently taking their intersection.
+    X, Y = xr.align(X, Y, join="exact")
+
+    # A linear fit has a closed form, so this is done with xarray reductions rather
+    # than a least squares solve. This also keeps dask arrays lazy.
+    if nan_policy in ["omit", "drop"]:
+        # Fit only over the indices where both ``x`` and ``y`` are not nan.
+        mask = X.notnull() & Y.notnull()
+        X_fit, Y_fit, skipna = X.where(mask), Y.where(mask), True
+    else:
+        X_fit, Y_fit, skipna = X, Y, False
+    x_mean = X_fit.mean(dim, skipna=skipna)
+    y_mean = Y_fit.mean(dim, skipna=skipna)
+    x_anom = X_fit - x_mean
+    cov = (x_anom * (Y_fit - y_mean)).sum(dim, skipna=skipna)
+    x_var = (x_anom ** 2).sum(dim, skipna=skipna)
+    # ``x`` has no spread for a single (valid) time step or a constant predictor. As
+    # with ``rm_poly``, only the mean of ``y`` is removed in that case.
+    slope = (cov / x_var.where(x_var != 0)).where(x_var != 0, 0)
+
+    # Like ``rm_poly``, single precision data is returned in single precision when all
+    # grid cells share the same independent axis.
+    if (
+        isinstance(X, xr.DataArray)
+        and (X.ndim == 1)
+        and (nan_policy in ["none", "propagate"])
+    ):
+        dtype = _fit_dtype(Y)
+    else:
+        dtype = "float64"
+
+    def _rm_trend(x, y, x_mean, y_mean, slope):
+        return (y - (slope * (x - x_mean) + y_mean)).astype(dtype, copy=False)
+
+    # The fit is removed through ``xr.apply_ufunc`` with ``x`` and ``y`` leading, so
+    # that names and attributes are handled just like in ``rm_poly``.
+    detrended = xr.apply_ufunc(_rm_trend, X, Y, x_mean, y_mean, slope, dask="allowed")
+    # Match the dimension order of ``rm_poly``.
+    return detrended.transpose(..., dim)
 
 
 @is_xarray(0)
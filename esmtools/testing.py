@@ -9,6 +9,82 @@ from .constants import MULTIPLE_TESTS
 __all__ = ["ttest_ind_from_stats", "multipletests"]
 
 
+def _one_step_multipletests(p, ntests, alpha, method):
+    """Closed-form ``bonferroni`` and ``sidak`` corrections on ndarrays.
+
+    These corrections only depend on each p-value and the total number of tests,
+    so they can be applied blockwise without gathering the full array.
+
+    Args:
+        p (ndarray): uncorrected p-values. Non-finite values are returned as nans.
+        ntests (int or 0-d ndarray): number of finite tests across the full array.
+        alpha (float): FWER, family-wise error rate.
+        method (str): One of 'bonferroni' or 'sidak'.
+
+    Returns:
+        reject (ndarray): 1.0 for hypothesis that can be rejected for given alpha,
+            0.0 otherwise and nan where ``p`` is not finite.
+        pvals_corrected (ndarray): p-values corrected for multiple tests.
+    """
+    if ntests == 0:
+        # No p-value is finite, so there is nothing to correct.
+        return np.full(p.shape, np.nan), np.full(p.shape, np.nan)
+    # Operations are done in place where possible so that each output is only
+    # allocated once.
+    if method == "bonferroni":
+        alphac = alpha / ntests
+        pvals_corrected = np.multiply(p, ntests, dtype="float64")
+        np.minimum(pvals_corrected, 1, out=pvals_corrected)
+    else:
+        alphac = 1 - np.power((1.0 - alpha), 1.0 / ntests)
+        with np.errstate(invalid="ignore"):
+            pvals_corrected = np.log1p(-p, dtype="float64")
+        pvals_corrected *= ntests
+        np.expm1(pvals_corrected, out=pvals_corrected)
+        np.negative(pvals_corrected, out=pvals_corrected)
+    reject = np.empty(p.shape)
+    np.less_equal(p, alphac, out=reject)
+    # Match the other methods, which only correct finite p-values.
+    nonfinite = ~np.isfinite(p)
+    reject[nonfinite] = np.nan
+    pvals_corrected[nonfinite] = np.nan
+    return reject, pvals_corrected
+
+
+def _fdr_multipletests(p, alpha, method):
+    """Benjamini/Hochberg (``fdr_bh``) and Benjamini/Yekutieli (``fdr_by``) step-up
+    corrections on a 1D ndarray without nans.
+
+    This mirrors ``statsmodels.stats.multitest.fdrcorrection``, but returns results in
+    sorted order along with the sorting indices so that the caller can scatter them
+    straight into its output arrays.
+
+    Args:
+        p (ndarray): 1D uncorrected p-values without nans.
+        alpha (float): FWER, family-wise error rate.
+        method (str): One of 'fdr_bh' or 'fdr_by'.
+
+    Returns:
+        order (ndarray): Indices that sort ``p``.
+        reject (ndarray): Sorted booleans, true for hypothesis that can be rejected
+            for given alpha.
+        pvals_corrected (ndarray): Sorted p-values corrected for multiple tests.
+    """
+    ntests = p.size
+    order = np.argsort(p)
+    p_sorted = p[order]
+    ecdffactor = np.arange(1, ntests + 1) / ntests
+    if method == "fdr_by":
+        ecdffactor /= np.sum(1.0 / np.arange(1, ntests + 1))
+    reject = p_sorted <= ecdffactor * alpha
+    if reject.any():
+        reject[: np.flatnonzero(reject)[-1]] = True
+    # Step-up: each corrected p-value is the minimum over all larger p-values.
+    pvals_corrected = np.minimum.accumulate((p_sorted / ecdffactor)[::-1])[::-1]
+    np.minimum(pvals_corrected, 1, out=pvals_corrected)
+    return order, reject, pvals_corrected
+
+
 @is_xarray(0)
 def multipletests(p, alpha=0.05, method=None, **multipletests_kwargs):
     """Apply statsmodels.stats.multitest.multipletests for multi-dimensional
@@ -52,25 +128,66 @@ def multipletests(p, alpha=0.05, method=None, **multipletests_kwargs):
             f"Your method '{method}' is not in the accepted methods: {MULTIPLE_TESTS}"
         )
 
-    # stack all to 1d array
-    p_stacked = p.stack(s=p.dims)
+    # One-step methods don't need the full sorted array, so they skip statsmodels,
+    # stay lazy and run blockwise on dask arrays. ``is_sorted`` has no effect on
+    # them, but ``returnsorted`` does, so that case is left to statsmodels.
+    if method in ["bonferroni", "sidak"] and not multipletests_kwargs.get(
+        "returnsorted", False
+    ):
+        # The count is kept as a 0-d array rather than an int so that it is only
+        # computed alongside the corrections for dask arrays.
+        ntests = np.isfinite(p).sum()
+        return xr.apply_ufunc(
+            _one_step_multipletests,
+            p,
+            ntests,
+            alpha,
+            method,
+            input_core_dims=[[], [], [], []],
+            output_core_dims=[[], []],
+            dask="parallelized",
+            output_dtypes=["float64", "float64"],
+            keep_attrs=True,
+        )
 
-    # mask only where not nan:
-    # https://github.com/statsmodels/statsmodels/issues/2899
-    mask = np.isfinite(p_stacked)
-    pvals_corrected = xr.full_like(p_stacked, np.nan)
-    reject = xr.full_like(p_stacked, np.nan)
+    # Work on the flattened values directly rather than stacking to a
+    # MultiIndex, which is expensive to build and to unstack.
+    flat = np.ascontiguousarray(p.values).ravel()
 
-    # apply test where mask
-    reject[mask], pvals_corrected[mask], *_ = statsmodels_multipletests(
-        p_stacked[mask], alpha=alpha, method=method, **multipletests_kwargs
-    )
+    # only apply test where not nan:
+    # https://github.com/statsmodels/statsmodels/issues/2899
+    idx = np.flatnonzero(np.isfinite(flat))
+    pvals_corrected = np.full(flat.shape, np.nan)
+    reject = np.full(flat.shape, np.nan)
+
+    if idx.size == 0:
+        # Every p-value is nan, so there is nothing to correct.
+        pass
+    elif method in ["fdr_bh", "fdr_by"] and not multipletests_kwargs:
+        order, reject_sorted, pvals_corrected_sorted = _fdr_multipletests(
+            flat[idx], alpha, method
+        )
+        idx = idx[order]
+        reject[idx], pvals_corrected[idx] = reject_sorted, pvals_corrected_sorted
+    else:
+        reject[idx], pvals_corrected[idx], *_ = statsmodels_multipletests(
+            flat[idx], alpha=alpha, method=method, **multipletests_kwargs
+        )
 
-    return reject.unstack("s"), pvals_corrected.unstack("s")
+    # Wrap the raw arrays only once, reusing the coordinates, name and attributes of
+    # ``p`` without realigning them.
+    reject = p.copy(data=reject.reshape(p.shape))
+    pvals_corrected = p.copy(data=pvals_corrected.reshape(p.shape))
+    if p.chunks is not None:
+        # Return dask arrays chunked like the input.
+        chunks = dict(zip(p.dims, p.chunks))
+        reject = reject.chunk(chunks)
+        pvals_corrected = pvals_corrected.chunk(chunks)
+    return reject, pvals_corrected
 
 
 def ttest_ind_from_stats(mean1, std1, nobs1, mean2, std2, nobs2, equal_var=True):
-    """Parallelize scipy.stats.ttest_ind_from_stats and make dask-compatible.
+    """Apply scipy.stats.ttest_ind_from_stats to xr.objects and make dask-compatible.
 
     Args:
         mean1, mean2 (array_like): The means of samples 1 and 2.
@@ -84,17 +201,20 @@ def ttest_ind_from_stats(mean1, std1, nobs1, mean2, std2, nobs2, equal_var=True)
         statistic (float or array): The calculated t-statistics.
         pvalue (float or array): The two-tailed p-value.
     """
+    args = (mean1, std1, nobs1, mean2, std2, nobs2)
+    # Nothing to wrap, so skip the overhead of ``xr.apply_ufunc``.
+    if not any(isinstance(arg, (xr.Dataset, xr.DataArray)) for arg in args):
+        return tti_from_stats(*args, equal_var=equal_var)
+    # ``scipy.stats.ttest_ind_from_stats`` is already vectorized, so it's applied
+    # once per array (or dask chunk) rather than once per grid cell. Output dtypes
+    # are given so that dask doesn't have to compute a sample to infer them.
     return xr.apply_ufunc(
         tti_from_stats,
-        mean1,
-        std1,
-        nobs1,
-        mean2,
-        std2,
-        nobs2,
-        equal_var,
-        input_core_dims=[[], [], [], [], [], [], []],
+        *args,
+        kwargs={"equal_var": equal_var},
+        input_core_dims=[[], [], [], [], [], []],
         output_core_dims=[[], []],
-        vectorize=True,
         dask="parallelized",
+        output_dtypes=[np.float64, np.float64],
+        keep_attrs=True,
     )
@@ -1,3 +1,6 @@
+import numpy as np
+import pytest
+import scipy.stats
 import xarray as xr
 
 from esmtools.stats import autocorr, corr
@@ -58,7 +61,37 @@ def test_corr_return_p(gridded_da_float):
     x = gridded_da_float()
     y = gridded_da_float()
     corrcoeff, pval = corr(x, y, dim="time", return_p=True)
-    assert not (corrcoeff.isnull().any()) & (pval.isnull().any())
+    assert not corrcoeff.isnull().any()
+    assert not pval.isnull().any()
+
+
+@pytest.mark.parametrize("chunk", (True, False))
+@pytest.mark.parametrize("lead", (0, 3, -3))
+def test_corr_against_scipy(gridded_da_float, lead, chunk):
+    """Tests that the correlation coefficient and p value match ``scipy`` for every
+    grid cell, and that grid cells with nans return nans."""
+    x = gridded_da_float()
+    y = gridded_da_float()
+    x[:, 0, 0] = np.nan
+    if chunk:
+        x, y = x.chunk(), y.chunk()
+    corrcoeff, pval = corr(x, y, dim="time", lead=lead, return_p=True)
+    corrcoeff, pval = corrcoeff.compute(), pval.compute()
+    N = x.time.size
+    if lead < 0:
+        x, y, lead = y, x, -lead
+    for i in range(3):
+        for j in range(3):
+            x_ij = x.isel(lat=i, lon=j, time=slice(0, N - lead)).values
+            y_ij = y.isel(lat=i, lon=j, time=slice(lead, N)).values
+            if np.isnan(x_ij).any() or np.isnan(y_ij).any():
+                expected_r, expected_p = np.nan, np.nan
+            else:
+                expected_r, expected_p = scipy.stats.pearsonr(x_ij, y_ij)
+            actual_r = corrcoeff.isel(lat=i, lon=j).values
+            actual_p = pval.isel(lat=i, lon=j).values
+            assert np.allclose(actual_r, expected_r, equal_nan=True)
+            assert np.allclose(actual_p, expected_p, equal_nan=True)
 
 
 def test_autocorr(gridded_da_float):
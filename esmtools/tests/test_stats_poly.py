@@ -1,3 +1,4 @@
+import dask
 import numpy as np
 import numpy.polynomial.polynomial as poly
 import pytest
@@ -9,8 +10,9 @@ TIME_TYPES = ["datetime", "cftime", "float"]
 
 
 def _np_rm_poly(x, y, order):
-    coefs = poly.polyfit(x, y, order)
-    fit = poly.polyval(x, coefs)
+    # ``Polynomial.fit`` maps ``x`` onto [-1, 1] so the reference stays accurate for
+    # higher orders on e.g. a 1900-1960 time axis.
+    fit = poly.Polynomial.fit(x, y, order)(x)
     return y - fit
 
 
@@ -19,16 +21,14 @@ def _np_rm_poly(x, y, order):
 @pytest.mark.parametrize("order", (1, 2, 3, 4))
 @pytest.mark.parametrize("single_arg", (True, False))
 def test_rm_poly_against_time(
-    gridded_da_datetime,
-    gridded_da_cftime,
-    gridded_da_float,
+    request,
     time_type,
     gridded,
     order,
     single_arg,
 ):
     """Tests that ``rm_poly`` works against a time index."""
-    data = eval(f"gridded_da_{time_type}")()
+    data = request.getfixturevalue(f"gridded_da_{time_type}")()
     x = data["time"]
     y = data if gridded else data.isel(lat=0, lon=0)
     if single_arg:
@@ -42,15 +42,13 @@ def test_rm_poly_against_time(
 @pytest.mark.parametrize("time_type", TIME_TYPES)
 @pytest.mark.parametrize("single_arg", (True, False))
 def test_rm_poly_against_time_dask(
-    gridded_da_datetime,
-    gridded_da_cftime,
-    gridded_da_float,
+    request,
     time_type,
     gridded,
     single_arg,
 ):
     """Tests that ``rm_poly`` works against a time index with dask arrays."""
-    data = eval(f"gridded_da_{time_type}")()
+    data = request.getfixturevalue(f"gridded_da_{time_type}")()
     x = data["time"]
     y = data if gridded else data.isel(lat=0, lon=0)
     if single_arg:
@@ -95,7 +93,7 @@ def test_rm_poly_validity(gridded_da_float, order):
         for j in range(3):
             single_grid_cell = y.isel(lon=i, lat=j)
             expected = _np_rm_poly(x.values, single_grid_cell.values, order)
-            assert (actual.isel(lon=i, lat=j).values == expected).all()
+            assert np.allclose(actual.isel(lon=i, lat=j).values, expected)
 
 
 @pytest.mark.parametrize("order", (1, 2, 3, 4))
@@ -110,23 +108,40 @@ def test_rm_poly_validity_dask(gridded_da_float, order):
         for j in range(3):
             single_grid_cell = y.isel(lon=i, lat=j)
             expected = _np_rm_poly(x.values, single_grid_cell.values, order)
-            assert (actual.isel(lon=i, lat=j).values == expected).all()
+            assert np.allclose(actual.isel(lon=i, lat=j).values, expected)
+
+
+@pytest.mark.parametrize("order", (1, 2, 3, 4))
+@pytest.mark.parametrize("chunk", (True, False))
+def test_rm_poly_float32(gridded_da_float, order, chunk):
+    """Tests that ``rm_poly``, ``polyfit`` and ``rm_trend`` preserve single precision
+    and agree with the double precision fit."""
+    data = gridded_da_float()
+    expected = rm_poly(data, order=order)
+    data32 = data.astype("float32")
+    data32 = data32.chunk() if chunk else data32
+    actual = rm_poly(data32, order=order)
+    fit = polyfit(data32, order=order)
+    trend = rm_trend(data32)
+    assert actual.dtype == "float32"
+    assert fit.dtype == "float32"
+    assert trend.dtype == "float32"
+    assert np.allclose(actual.compute(), expected, atol=1e-5)
+    assert np.allclose(trend.compute(), rm_trend(data), atol=1e-5)
 
 
 @pytest.mark.parametrize("gridded", (True, False))
 @pytest.mark.parametrize("time_type", TIME_TYPES)
 @pytest.mark.parametrize("single_arg", (True, False))
 def test_rm_trend_against_time(
-    gridded_da_datetime,
-    gridded_da_cftime,
-    gridded_da_float,
+    request,
     time_type,
     gridded,
     single_arg,
 ):
     """Tests that ``rm_trend`` is equivelant to ``rm_poly`` with order=1 against time
     series."""
-    data = eval(f"gridded_da_{time_type}")()
+    data = request.getfixturevalue(f"gridded_da_{time_type}")()
     x = data["time"]
     y = data if gridded else data.isel(lat=0, lon=0)
     if single_arg:
@@ -149,14 +164,97 @@ def test_rm_trend_against_data(gridded_da_float, gridded):
     assert_allclose(expected, actual)
 
 
+@pytest.mark.parametrize("order", (1, 2))
+def test_rm_poly_single_time_step(gridded_da_float, order):
+    """Tests that ``rm_poly`` returns zeros for a single time step, where the
+    independent axis can't be scaled."""
+    data = gridded_da_float().isel(time=[0])
+    actual = rm_poly(data, order=order)
+    assert (actual == 0).all()
+
+
+def test_rm_trend_single_time_step(gridded_da_float):
+    """Tests that ``rm_trend`` returns zeros for a single time step like ``rm_poly``,
+    rather than dividing by zero."""
+    data = gridded_da_float().isel(time=[0])
+    actual = rm_trend(data)
+    assert (actual == 0).all()
+
+
+def test_rm_trend_constant_x(gridded_da_float):
+    """Tests that ``rm_trend`` only removes the mean of ``y`` for a constant
+    predictor, like ``rm_poly``."""
+    y = gridded_da_float()
+    x = y.isel(lat=0, lon=0) * 0 + 1
+    expected = rm_poly(x, y, 1)
+    actual = rm_trend(x, y)
+    assert_allclose(expected, actual)
+    assert_allclose(y - y.mean("time"), actual.transpose(*y.dims))
+
+
+def test_rm_trend_omit_single_valid_point(gridded_da_float):
+    """Tests that ``rm_trend`` matches ``rm_poly`` with ``nan_policy='omit'`` when a
+    grid cell only has one valid point."""
+    data = gridded_da_float()
+    data[1:, 0, 0] = np.nan
+    expected = rm_poly(data, order=1, nan_policy="omit")
+    actual = rm_trend(data, nan_policy="omit")
+    assert_allclose(expected, actual)
+    assert actual.isel(lat=0, lon=0, time=0) == 0
+
+
+@pytest.mark.parametrize("nan_policy", ("none", "omit"))
+def test_rm_trend_missing_data(gridded_da_missing_data, nan_policy):
+    """Tests that ``rm_trend`` is equivelant to ``rm_poly`` with order=1 when there is
+    missing data."""
+    data = gridded_da_missing_data
+    expected = rm_poly(data, order=1, nan_policy=nan_policy)
+    actual = rm_trend(data, nan_policy=nan_policy)
+    assert_allclose(expected, actual)
+
+
+def test_rm_trend_mismatched_axis(gridded_da_float):
+    """Tests that ``rm_trend`` raises like ``rm_poly`` when ``x`` and ``y`` don't
+    share the same coordinates along ``dim``."""
+    y = gridded_da_float()
+    x = y.isel(lat=0, lon=0).copy()
+    x["time"] = x["time"] + 1
+    with pytest.raises(ValueError):
+        rm_poly(x, y, 1)
+    with pytest.raises(ValueError):
+        rm_trend(x, y)
+
+
+@pytest.mark.parametrize("single_arg", (True, False))
+def test_rm_trend_name_and_attrs(gridded_da_float, single_arg):
+    """Tests that ``rm_trend`` handles names and attributes like ``rm_poly``."""
+    y = gridded_da_float().rename("sst")
+    y.attrs["units"] = "K"
+    args = (y,) if single_arg else (y.isel(lat=0, lon=0), y)
+    expected = rm_poly(*args, order=1)
+    actual = rm_trend(*args)
+    assert actual.name == expected.name
+    assert actual.attrs == expected.attrs
+
+
+def test_rm_trend_dask_lazy(gridded_da_float):
+    """Tests that ``rm_trend`` doesn't compute dask arrays until asked to."""
+
+    def raise_if_computed(dsk, keys, **kwargs):
+        raise RuntimeError("dask array was computed")
+
+    data = gridded_da_float().chunk()
+    with dask.config.set(scheduler=raise_if_computed):
+        actual = rm_trend(data)
+    assert_allclose(rm_trend(data.compute()), actual.compute())
+
+
 @pytest.mark.parametrize("gridded", (True, False))
 @pytest.mark.parametrize("time_type", TIME_TYPES)
 @pytest.mark.parametrize("order", (1, 2, 3, 4))
 @pytest.mark.parametrize("single_arg", (True, False))
 def test_polyfit_against_time(
-    gridded_da_datetime,
-    gridded_da_cftime,
-    gridded_da_float,
+    request,
     time_type,
     gridded,
     order,
@@ -164,7 +262,7 @@ def test_polyfit_against_time(
 ):
     """Tests that ``polyfit`` plus ``rm_poly`` equals the original time series when
     fitting against time."""
-    data = eval(f"gridded_da_{time_type}")()
+    data = request.getfixturevalue(f"gridded_da_{time_type}")()
     x = data["time"]
     y = data if gridded else data.isel(lat=0, lon=0)
     if single_arg:
@@ -181,16 +279,14 @@ def test_polyfit_against_time(
 @pytest.mark.parametrize("time_type", TIME_TYPES)
 @pytest.mark.parametrize("single_arg", (True, False))
 def test_polyfit_against_time_dask(
-    gridded_da_datetime,
-    gridded_da_cftime,
-    gridded_da_float,
+    request,
     time_type,
     gridded,
     single_arg,
 ):
     """Tests that ``polyfit`` plus ``rm_poly`` equals the original time series when
     fitting against time with dask arrays."""
-    data = eval(f"gridded_da_{time_type}")().chunk()
+    data = request.getfixturevalue(f"gridded_da_{time_type}")().chunk()
     x = data["time"]
     y = data if gridded else data.isel(lat=0, lon=0)
     if single_arg:
@@ -226,3 +322,15 @@ def test_polyfit_against_data_dask(gridded_da_float, gridded):
     fit = polyfit(x, y, 2)
     diff = np.abs((dt + fit) - y)
     assert (diff.compute() < 1e-15).all()
+
+
+@pytest.mark.parametrize("func", (polyfit, rm_poly))
+def test_poly_dataset_x(gridded_ds_float, func):
+    """Tests that ``polyfit`` and ``rm_poly`` work with a Dataset as the independent
+    variable, fitting each variable against its counterpart in ``x``."""
+    x = gridded_ds_float.isel(lat=0, lon=0)
+    y = gridded_ds_float
+    actual = func(x, y, 2)
+    for var in y.data_vars:
+        expected = func(x[var], y[var], 2)
+        assert_allclose(expected, actual[var])
@@ -12,9 +12,7 @@ TIME_TYPES = ["datetime", "cftime", "float"]
 @pytest.mark.parametrize("func", (linear_slope, linregress))
 @pytest.mark.parametrize("single_arg", (True, False))
 def test_linear_regression_time_da(
-    gridded_da_datetime,
-    gridded_da_cftime,
-    gridded_da_float,
+    request,
     time_type,
     gridded,
     func,
@@ -22,7 +20,7 @@ def test_linear_regression_time_da(
 ):
     """Tests that linear slope can be computed on an in-memory DataArray with respect to
     time."""
-    data = eval(f"gridded_da_{time_type}")()
+    data = request.getfixturevalue(f"gridded_da_{time_type}")()
     x = data["time"]
     y = data if gridded else data.isel(lat=0, lon=0)
     if single_arg:
@@ -42,9 +40,7 @@ def test_linear_regression_time_da(
 @pytest.mark.parametrize("func", (linear_slope, linregress))
 @pytest.mark.parametrize("single_arg", (True, False))
 def test_linear_regression_singular_data_da(
-    gridded_da_datetime,
-    gridded_da_cftime,
-    gridded_da_float,
+    request,
     time_type,
     gridded,
     func,
@@ -52,7 +48,7 @@ def test_linear_regression_singular_data_da(
 ):
     """Tests that ``linear_slope`` works between a grid or time series of data and
     another singular data (e.g., a Nino index)."""
-    data = eval(f"gridded_da_{time_type}")()
+    data = request.getfixturevalue(f"gridded_da_{time_type}")()
     x = data.isel(lat=0, lon=0)
     y = data if gridded else data.isel(lat=0, lon=0)
     if single_arg:
@@ -69,13 +65,11 @@ def test_linear_regression_singular_data_da(
 
 @pytest.mark.parametrize("time_type", TIME_TYPES)
 @pytest.mark.parametrize("func", (linear_slope, linregress))
-def test_linear_regression_gridded_to_gridded(
-    gridded_da_datetime, gridded_da_cftime, gridded_da_float, time_type, func
-):
+def test_linear_regression_gridded_to_gridded(request, time_type, func):
     """Tests that ``linear_slope`` works between one grid of data and another grid
     of data."""
-    data1 = eval(f"gridded_da_{time_type}")()
-    data2 = eval(f"gridded_da_{time_type}")()
+    data1 = request.getfixturevalue(f"gridded_da_{time_type}")()
+    data2 = request.getfixturevalue(f"gridded_da_{time_type}")()
     result = func(data1, data2, "time")
     assert not result.isnull().any()
     expected_shape = (3, 3) if func == linear_slope else (3, 3, 5)
@@ -87,9 +81,7 @@ def test_linear_regression_gridded_to_gridded(
 @pytest.mark.parametrize("func", (linear_slope, linregress))
 @pytest.mark.parametrize("single_arg", (True, False))
 def test_linear_regression_time_ds(
-    gridded_ds_datetime,
-    gridded_ds_cftime,
-    gridded_ds_float,
+    request,
     time_type,
     gridded,
     func,
@@ -97,7 +89,7 @@ def test_linear_regression_time_ds(
 ):
     """Tests that linear slope can be computed on an in-memory Dataset with respect to
     time."""
-    ds = eval(f"gridded_ds_{time_type}")
+    ds = request.getfixturevalue(f"gridded_ds_{time_type}")
     x = ds["time"]
     if not gridded:
         ds = ds.isel(lat=0, lon=0)
@@ -121,16 +113,14 @@ def test_linear_regression_time_ds(
 @pytest.mark.parametrize("func", (linear_slope, linregress))
 @pytest.mark.parametrize("single_arg", (True, False))
 def test_linear_regression_da_dask(
-    gridded_da_datetime,
-    gridded_da_cftime,
-    gridded_da_float,
+    request,
     time_type,
     gridded,
     func,
     single_arg,
 ):
     """Tests that linear slope can be computed on a dask DataArray."""
-    data = eval(f"gridded_da_{time_type}")().chunk()
+    data = request.getfixturevalue(f"gridded_da_{time_type}")().chunk()
     x = data["time"]
     y = data if gridded else data.isel(lat=0, lon=0)
     if single_arg:
@@ -147,16 +137,14 @@ def test_linear_regression_da_dask(
 @pytest.mark.parametrize("func", (linear_slope, linregress))
 @pytest.mark.parametrize("single_arg", (True, False))
 def test_linear_slope_ds_dask(
-    gridded_ds_datetime,
-    gridded_ds_cftime,
-    gridded_ds_float,
+    request,
     time_type,
     gridded,
     func,
     single_arg,
 ):
     """Tests that linear slope can be computed on a dask Dataset."""
-    ds = eval(f"gridded_ds_{time_type}").chunk()
+    ds = request.getfixturevalue(f"gridded_ds_{time_type}").chunk()
     x = ds["time"]
     if not gridded:
         ds = ds.isel(lat=0, lon=0)
@@ -0,0 +1,129 @@
+import dask
+import numpy as np
+import pytest
+import scipy.stats
+from statsmodels.stats.multitest import multipletests as statsmodels_multipletests
+from xarray.testing import assert_allclose
+
+from esmtools.constants import MULTIPLE_TESTS
+from esmtools.testing import multipletests, ttest_ind_from_stats
+
+
+@pytest.mark.parametrize("method", MULTIPLE_TESTS)
+def test_multipletests_against_statsmodels(gridded_da_landmask, method):
+    """Tests that ``multipletests`` matches ``statsmodels`` on the non-nan p-values
+    and retains nans and coordinates from the input."""
+    p = gridded_da_landmask.isel(time=0) / 10
+    p.attrs["units"] = "unitless"
+    reject, pvals_corrected = multipletests(p, method=method)
+    assert pvals_corrected.attrs == p.attrs
+    assert reject.dims == p.dims
+    assert pvals_corrected.dims == p.dims
+    assert (pvals_corrected.lat == p.lat).all()
+    assert (reject.isnull() == p.isnull()).all()
+    assert (pvals_corrected.isnull() == p.isnull()).all()
+    flat = p.values.ravel()
+    mask = np.isfinite(flat)
+    expected_reject, expected_pvals, *_ = statsmodels_multipletests(
+        flat[mask], method=method
+    )
+    assert np.allclose(reject.values.ravel()[mask], expected_reject)
+    assert np.allclose(pvals_corrected.values.ravel()[mask], expected_pvals)
+
+
+@pytest.mark.parametrize("method", ("bonferroni", "sidak", "fdr_bh"))
+def test_multipletests_dask(gridded_da_landmask, method):
+    """Tests that ``multipletests`` works with dask arrays."""
+    p = gridded_da_landmask.isel(time=0) / 10
+    expected_reject, expected_pvals = multipletests(p, method=method)
+    actual_reject, actual_pvals = multipletests(p.chunk({"lat": 1}), method=method)
+    assert actual_reject.chunks == p.chunk({"lat": 1}).chunks
+    assert actual_pvals.chunks == p.chunk({"lat": 1}).chunks
+    assert_allclose(expected_reject, actual_reject.compute())
+    assert_allclose(expected_pvals, actual_pvals.compute())
+
+
+@pytest.mark.parametrize("method", ("bonferroni", "sidak", "fdr_bh", "holm"))
+def test_multipletests_all_nan(gridded_da_float, method):
+    """Tests that ``multipletests`` returns nans if every p-value is nan."""
+    p = gridded_da_float().isel(time=0) * np.nan
+    reject, pvals_corrected = multipletests(p, method=method)
+    assert reject.isnull().all()
+    assert pvals_corrected.isnull().all()
+
+
+@pytest.mark.parametrize("method", ("bonferroni", "sidak", "fdr_bh", "holm"))
+def test_multipletests_inf(gridded_da_float, method):
+    """Tests that infinite p-values are excluded from the tests for every method."""
+    p = gridded_da_float().isel(time=0) / 10
+    p_inf = p.copy()
+    p_inf[0, 0] = np.inf
+    p_nan = p.copy()
+    p_nan[0, 0] = np.nan
+    expected_reject, expected_pvals = multipletests(p_nan, method=method)
+    actual_reject, actual_pvals = multipletests(p_inf, method=method)
+    assert_allclose(expected_reject, actual_reject)
+    assert_allclose(expected_pvals, actual_pvals)
+
+
+@pytest.mark.parametrize("method", ("bonferroni", "sidak"))
+def test_multipletests_one_step_lazy(gridded_da_landmask, method):
+    """Tests that one-step methods don't compute dask arrays until asked to."""
+
+    def raise_if_computed(dsk, keys, **kwargs):
+        raise RuntimeError("dask array was computed")
+
+    p = gridded_da_landmask.isel(time=0).chunk({"lat": 1}) / 10
+    with dask.config.set(scheduler=raise_if_computed):
+        multipletests(p, method=method)
+
+
+def test_multipletests_no_method(gridded_da_float):
+    """Tests that ``multipletests`` raises an error if no method is passed."""
+    with pytest.raises(ValueError, match="Please indicate a method"):
+        multipletests(gridded_da_float().isel(time=0))
+
+
+@pytest.mark.parametrize("equal_var", (True, False))
+def test_ttest_ind_from_stats_against_scipy(gridded_da_float, equal_var):
+    """Tests that ``ttest_ind_from_stats`` matches ``scipy`` for every grid cell."""
+    x = gridded_da_float()
+    y = gridded_da_float() + 0.1
+    mean1, std1, nobs1 = x.mean("time"), x.std("time"), x.time.size
+    mean2, std2, nobs2 = y.mean("time"), y.std("time"), y.time.size
+    t, p = ttest_ind_from_stats(mean1, std1, nobs1, mean2, std2, nobs2, equal_var)
+    for i in range(3):
+        for j in range(3):
+            expected_t, expected_p = scipy.stats.ttest_ind_from_stats(
+                mean1.isel(lat=i, lon=j).values,
+                std1.isel(lat=i, lon=j).values,
+                nobs1,
+                mean2.isel(lat=i, lon=j).values,
+                std2.isel(lat=i, lon=j).values,
+                nobs2,
+                equal_var=equal_var,
+            )
+            assert np.allclose(t.isel(lat=i, lon=j).values, expected_t)
+            assert np.allclose(p.isel(lat=i, lon=j).values, expected_p)
+
+
+@pytest.mark.parametrize("equal_var", (True, False))
+def test_ttest_ind_from_stats_dask(gridded_da_float, equal_var):
+    """Tests that ``ttest_ind_from_stats`` works with dask arrays."""
+    x = gridded_da_float()
+    y = gridded_da_float()
+    args = (x.mean("time"), x.std("time"), 60, y.mean("time"), y.std("time"), 60)
+    expected_t, expected_p = ttest_ind_from_stats(*args, equal_var=equal_var)
+    dask_args = [a.chunk() if hasattr(a, "chunk") else a for a in args]
+    actual_t, actual_p = ttest_ind_from_stats(*dask_args, equal_var=equal_var)
+    assert_allclose(expected_t, actual_t.compute())
+    assert_allclose(expected_p, actual_p.compute())
+
+
+def test_ttest_ind_from_stats_numpy():
+    """Tests that ``ttest_ind_from_stats`` works directly on ndarrays."""
+    args = (np.random.rand(3, 3), np.random.rand(3, 3) + 0.1, 60) * 2
+    actual_t, actual_p = ttest_ind_from_stats(*args)
+    expected_t, expected_p = scipy.stats.ttest_ind_from_stats(*args)
+    assert np.allclose(actual_t, expected_t)
+    assert np.allclose(actual_p, expected_p)
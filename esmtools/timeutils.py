@@ -50,11 +50,13 @@ class TimeUtilAccessor:
 
     @property
     def slope_factor(self):
-        if self.freq is None:
+        # Only infer the frequency once, since it requires a pass over the time axis.
+        freq = self.freq
+        if freq is None:
             return 1.0
         else:
             slope_factors = self.construct_slope_factors()
-            return slope_factors[self.freq]
+            return slope_factors[freq]
 
     def return_numeric_time(self):
         """Returns numeric time."""
@@ -117,14 +119,17 @@ class TimeUtilAccessor:
         return years
 
     def construct_slope_factors(self):
+        # Look up the calendar a single time rather than once per alias.
+        annual_factor = self.annual_factor
+
         years = self.construct_annual_aliases()
-        years = {k: self.annual_factor for k in years}
+        years = {k: annual_factor for k in years}
 
         quarters = self.construct_quarterly_aliases()
-        quarters = {k: self.annual_factor / 4 for k in quarters}
+        quarters = {k: annual_factor / 4 for k in quarters}
 
         months = ("M", "BM", "CBM", "MS", "BMS", "CBMS")
-        months = {k: self.annual_factor / 12 for k in months}
+        months = {k: annual_factor / 12 for k in months}
 
         semimonths = {k: 15 for k in ("SM", "SMS")}
 